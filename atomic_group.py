@@ -1,4 +1,6 @@
 from __future__ import annotations
+import sys
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import final
 from element import Element
@@ -11,6 +13,10 @@ type GroupElements = tuple[tuple[GroupComponent, int]]
 
 NO_VALENCE = "NO_VALENCE"
 
+_COUNT_STRS = tuple(str(i) for i in range(33))
+_FIRST = itemgetter(0)
+_SECOND = itemgetter(1)
+
 
 @dataclass(frozen=True)
 class AtomicGroupData:
@@ -30,6 +36,33 @@ class AtomicGroupData:
     symbol: str | None = None
     elements_key: bool = True
 
+    def __post_init__(self) -> None:
+        """
+        Compute the hash once, since hashing the nested elements tuple is not cheap.
+        """
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.elements,
+                    self.valence,
+                    self.base_symbol,
+                    self.symbol,
+                    self.elements_key,
+                )
+            ),
+        )
+
+    def __hash__(self) -> int:
+        """
+        Return the hash cached at construction.
+
+        Returns:
+            int: Hash of all fields.
+        """
+        return self._hash
+
 
 @final
 class AtomicGroup(BaseChemicalEntity[AtomicGroupData, tuple[str]]):
@@ -41,21 +74,42 @@ class AtomicGroup(BaseChemicalEntity[AtomicGroupData, tuple[str]]):
 
     Attributes:
         elements (GroupElements): Composition of elements and their counts.
+        _comps (tuple[GroupComponent, ...]): Components of ``elements``, in order.
+        _counts (tuple[int, ...]): Counts of ``elements``, parallel to ``_comps``.
         valence (int | None): Calculated total valence of the group.
         base_symbol (str): Base symbol of the group.
         symbol (str): Display symbol of the group.
     """
 
+    __slots__ = ("elements", "_comps", "_counts", "valence", "base_symbol")
+
+    _KIND = 2
+
     def generate_key(self) -> tuple[str]:
         """
-        Generate registry keys from component tuple.
+        Return the registry keys computed in ``_init``.
 
         Returns:
             tuple[str]: Registry keys.
         """
-        if self.data.elements_key:
-            return (self.symbol, self.elements)
-        return (self.symbol,)
+        return self.keys
+
+    @classmethod
+    def precheck_key(cls, data: AtomicGroupData) -> str | GroupElements | None:
+        """
+        Return the explicit symbol, or else the elements if they are a key.
+
+        Args:
+            data (AtomicGroupData): Data for the prospective atomic group.
+
+        Returns:
+            str | GroupElements | None: Registry key, or None if only the generated symbol is.
+        """
+        if data.symbol:
+            return data.symbol
+        if data.elements_key:
+            return data.elements
+        return None
 
     def generate_valence(self) -> int | None:
         """
@@ -72,15 +126,14 @@ class AtomicGroup(BaseChemicalEntity[AtomicGroupData, tuple[str]]):
         if self.data.valence is not None:
             return self.data.valence
         total = 0
-        for item in self.elements:
-            match item:
-                case (ValenceElement(valence=v), count) | (
-                    AtomicGroup(valence=v),
-                    count,
-                ):
-                    total += v * count
-                case _:
-                    return None
+        comps = self._comps
+        counts = self._counts
+        for i in range(len(comps)):
+            e = comps[i]
+            if e._KIND:
+                total += e.valence * counts[i]
+            else:
+                return None
         return total
 
     def generate_base_symbol(self) -> str:
@@ -95,37 +148,21 @@ class AtomicGroup(BaseChemicalEntity[AtomicGroupData, tuple[str]]):
         """
         if self.data.base_symbol:
             return self.data.base_symbol
-        li = []
-        for item in self.elements:
-            match item:
-                case (Element() as e, 1):
-                    li.append(e.symbol)
-                case (ValenceElement() as e, 1) | (AtomicGroup() as e, 1):
-                    li.append(e.base_symbol)
-                case (Element() as e, count):
-                    li.append(e.symbol)
-                    li.append(str(count))
-                case (ValenceElement() as e, count) | (AtomicGroup() as e, count):
-                    li.append(e.base_symbol)
-                    li.append(str(count))
-                case _:
-                    raise ValueError("Wrong Elements")
-        return "".join(li)
-
-    def generate_symbol(self) -> str:
-        """
-        Generate the display symbol of the atomic group.
-
-        The display symbol includes the base symbol and the valence (if applicable).
-
-        Returns:
-            str: Display symbol of the group.
-        """
-        if self.data.symbol:
-            return self.data.symbol
-        if self.valence is None:
-            return f"-{self.base_symbol}"
-        return f"-{self.base_symbol}({self.valence:+})"
+        parts: list[str] = []
+        extend = parts.extend
+        comps = self._comps
+        counts = self._counts
+        for i in range(len(comps)):
+            e = comps[i]
+            count = counts[i]
+            symbol = e.base_symbol if e._KIND else e.symbol
+            if count == 1:
+                extend((symbol,))
+            elif type(count) is int and 0 <= count < 33:
+                extend((symbol, _COUNT_STRS[count]))
+            else:
+                extend((symbol, str(count)))
+        return "".join(parts)
 
     def _init(self, index: int, data: AtomicGroupData) -> None:
         """
@@ -137,6 +174,19 @@ class AtomicGroup(BaseChemicalEntity[AtomicGroupData, tuple[str]]):
         """
         super()._init(index, data)
         self.elements = self.data.elements
-        self.valence = self.generate_valence()
-        self.base_symbol = self.generate_base_symbol()
-        self.symbol = self.generate_symbol()
\ No newline at end of file
+        self._comps = tuple(map(_FIRST, self.elements))
+        self._counts = tuple(map(_SECOND, self.elements))
+        self.valence = valence = self.generate_valence()
+        self.base_symbol = base_symbol = sys.intern(str(self.generate_base_symbol()))
+        # The display symbol is the base symbol plus the valence, if any.
+        if data.symbol:
+            symbol = data.symbol
+        elif valence is None:
+            symbol = "-" + base_symbol
+        else:
+            symbol = "".join(("-", base_symbol, "(", format(valence, "+"), ")"))
+        self.symbol = sys.intern(str(symbol))
+        if data.elements_key:
+            self.keys = (self.symbol, self.elements)
+        else:
+            self.keys = (self.symbol,)
@@ -1,13 +1,14 @@
 from __future__ import annotations
+import sys
 import threading
-from typing import ClassVar, Self, TypeVar, Generic, final, Iterable, Mapping
+from functools import lru_cache
+from typing import Callable, ClassVar, Self, TypeVar, Generic, Iterable, Mapping
 from abc import ABC, abstractmethod
 
 TData = TypeVar("TData")
 TKey = TypeVar("TKey")
 
 
-@final
 class BaseChemicalEntity(ABC, Generic[TData, TKey]):
     """
     Base class for chemical entities with a registry system.
@@ -16,30 +17,59 @@ class BaseChemicalEntity(ABC, Generic[TData, TKey]):
     entities, ensuring uniqueness and thread safety.
 
     Attributes:
-        registry (ClassVar[list[Self] | None]): List of all registered instances.
-        key_dictionary (ClassVar[dict[TKey, int] | None]): Mapping from keys to registry indices.
+        registry (ClassVar[list[Self]]): List of all registered instances.
+        key_dictionary (ClassVar[dict[TKey, Self]]): Mapping from keys to instances.
+        _data_cache (ClassVar[dict[TData, Self]]): Mapping from data objects to instances.
+        get (ClassVar[Callable[[str], Self]]): Memoized ``by_symbol``, cleared with the registry.
+        _KIND (ClassVar[int]): Entity kind tag: 0 for Element, 1 for ValenceElement,
+            2 for AtomicGroup. Non-zero kinds carry ``valence`` and ``base_symbol``.
         _lock (ClassVar[threading.Lock]): Thread lock for registry modifications.
+            Only the check-and-insert step of a write takes it; instances are
+            built beforehand and lookups read the containers without locking,
+            relying on list append and dict assignment being atomic. It is not
+            re-entrant, so ``_init`` must not create other entities.
         index (int): Index of the instance in the registry.
         data (TData): Data associated with the instance.
         symbol (str): Display symbol of the instance.
         keys (tuple[TKey]): Keys for the instance.
     """
 
-    registry: ClassVar[list[Self] | None] = None
-    key_dictionary: ClassVar[dict[TKey, int] | None] = None
-    _lock: ClassVar[threading.RLock] = threading.RLock()
+    __slots__ = ("index", "data", "symbol", "keys", "__weakref__")
+
+    registry: ClassVar[list[Self]]
+    key_dictionary: ClassVar[dict[TKey, Self]]
+    _data_cache: ClassVar[dict[TData, Self]]
+    get: ClassVar[Callable[[str], Self]]
+    _KIND: ClassVar[int]
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     index: int
     data: TData
     symbol: str
     keys: tuple[TKey]
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Give each subclass its own empty registry containers and lookup cache.
+
+        Args:
+            **kwargs: Forwarded to the parent implementation.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._new_containers()
+        cls.get = staticmethod(lru_cache(maxsize=256)(cls.by_symbol))
+
     def __new__(
         cls, identifier: int | TKey | None = None, data: TData | None = None
     ) -> Self:
         """
         Get an existing instance or create a new one.
 
+        Creating from data equal to an already registered instance's data
+        returns that instance instead of constructing a new one.
+        Hot lookups can call ``by_index`` or ``by_symbol`` directly to skip
+        the dispatch on the identifier type.
+
         Args:
             identifier (int | TKey | None): Existing ID or key for lookup.
             data (TData | None): Data for new instance creation.
@@ -52,36 +82,129 @@ class BaseChemicalEntity(ABC, Generic[TData, TKey]):
             IndexError: Invalid integer identifier.
             TypeError: Unsupported identifier type.
         """
-        if cls.registry is None:
-            cls.registry = []
-        if cls.key_dictionary is None:
-            cls.key_dictionary = {}
-
-        match (identifier, data):
-            case (None, None):
-                raise ValueError("Must provide identifier or data")
-            case (int() as i, None) if 0 <= i < len(cls.registry):
-                return cls.registry[i]
-            case (int(), None):
-                raise IndexError(f"Invalid index: {identifier}")
-            case (_, None) if identifier in cls.key_dictionary:  # type: ignore
-                return cls.registry[cls.key_dictionary[identifier]]  # type: ignore
-            case (_, None):
-                raise TypeError(f"Invalid identifier type: {type(identifier)}")
-            case _:
-                with cls._lock:
-                    instance = super().__new__(cls)
-                    instance._init(len(cls.registry), data)  # type: ignore
-
-                    keys = instance.generate_key()
-                    for key in keys:
-                        if key in cls.key_dictionary:
-                            raise ValueError(f"Key conflict: {key}")
-
-                    cls.registry.append(instance)
-                    for key in keys:
-                        cls.key_dictionary[key] = instance.index
-                    return instance
+        if data is not None:
+            # Identical (frozen, hashable) data yields the existing instance.
+            cached = cls._data_cache.get(data)
+            if cached is not None:
+                return cached
+            # Reject an obvious conflict before paying for _init.
+            key = cls.precheck_key(data)
+            if key is not None and key in cls.key_dictionary:
+                raise ValueError(f"Key conflict: {key}")
+            # Build outside the lock; only the check-and-insert is serialized.
+            instance = cls._build(data, len(cls.registry))
+            with cls._lock:
+                cached = cls._data_cache.get(data)
+                if cached is not None:
+                    return cached
+                if instance.index != len(cls.registry):
+                    # Another thread registered first; the index is stale.
+                    instance = cls._build(data, len(cls.registry))
+                cls._commit([instance])
+                return instance
+        if identifier is None:
+            raise ValueError("Must provide identifier or data")
+        if type(identifier) is int:
+            return cls.by_index(identifier)
+        instance = cls.key_dictionary.get(identifier)  # type: ignore
+        if instance is not None:
+            return instance
+        raise TypeError(f"Invalid identifier type: {type(identifier)}")
+
+    @classmethod
+    def by_index(cls, index: int) -> Self:
+        """
+        Look up an instance by registry index, skipping the __new__ dispatch.
+
+        Args:
+            index (int): Registry index.
+
+        Returns:
+            Self: Registered instance.
+
+        Raises:
+            IndexError: Invalid index.
+        """
+        registry = cls.registry
+        if 0 <= index < len(registry):
+            return registry[index]
+        raise IndexError(f"Invalid index: {index}")
+
+    @classmethod
+    def by_symbol(cls, symbol: str) -> Self:
+        """
+        Look up an instance by symbol, skipping the __new__ dispatch.
+
+        Args:
+            symbol (str): Registered symbol.
+
+        Returns:
+            Self: Registered instance.
+
+        Raises:
+            KeyError: Unknown symbol.
+        """
+        return cls.key_dictionary[symbol]  # type: ignore
+
+    @classmethod
+    def _build(cls, data: TData, index: int) -> Self:
+        """
+        Create and initialize an unregistered instance.
+
+        Args:
+            data (TData): Data for the new instance.
+            index (int): Registry index the instance is expected to take.
+
+        Returns:
+            Self: New instance with its keys generated.
+        """
+        instance = super().__new__(cls)
+        instance._init(index, data)  # type: ignore
+        instance.keys = instance.generate_key()
+        return instance
+
+    @classmethod
+    def _commit(cls, instances: list[Self]) -> None:
+        """
+        Add built instances to the registry; the caller must hold ``_lock``.
+
+        Every key is checked before anything is added, so a conflicting
+        batch registers nothing.
+
+        Args:
+            instances (list[Self]): Instances from ``_build``, indexed from ``len(registry)``.
+
+        Raises:
+            ValueError: Key conflict.
+        """
+        key_dictionary = cls.key_dictionary
+        new_keys: dict[TKey, Self] = {}
+        for instance in instances:
+            for key in instance.keys:
+                if key in key_dictionary or key in new_keys:
+                    raise ValueError(f"Key conflict: {key}")
+                if type(key) is str:
+                    key = sys.intern(key)
+                new_keys[key] = instance
+
+        # Append before publishing keys, so a key never resolves to an
+        # instance that is not in the registry.
+        cls.registry.extend(instances)
+        key_dictionary.update(new_keys)
+        data_cache = cls._data_cache
+        for instance in instances:
+            data_cache[instance.data] = instance
+
+    @classmethod
+    def _new_containers(cls) -> None:
+        """
+        Bind fresh, empty registry containers to the class.
+
+        Subclasses with extra lookup tables extend this to reset them too.
+        """
+        cls.registry = []
+        cls.key_dictionary = {}
+        cls._data_cache = {}
 
     @abstractmethod
     def generate_key(self) -> tuple[TKey]:
@@ -93,6 +216,22 @@ class BaseChemicalEntity(ABC, Generic[TData, TKey]):
         """
         ...
 
+    @classmethod
+    def precheck_key(cls, data: TData) -> TKey | None:
+        """
+        Derive one registry key from data without constructing an instance.
+
+        Subclasses override this when a key is cheap to read off the data, so
+        conflicting registrations fail before ``_init`` runs.
+
+        Args:
+            data (TData): Data for the prospective instance.
+
+        Returns:
+            TKey | None: A key the instance would be registered under, or None if unknown.
+        """
+        return None
+
     def _init(self, index: int, data: TData) -> None:
         """
         Initialize the instance attributes.
@@ -113,24 +252,69 @@ class BaseChemicalEntity(ABC, Generic[TData, TKey]):
         """
         return self.symbol
 
+    # str() would otherwise go through object.__str__ before reaching __repr__.
+    __str__ = __repr__
+
+    @classmethod
+    def _build_batch(cls, data_list: Iterable[TData], start: int) -> list[Self]:
+        """
+        Build unregistered instances for a batch, with indices from ``start``.
+
+        Data that is already registered or repeated in the batch is skipped.
+
+        Args:
+            data_list (Iterable[TData]): Data objects to build instances from.
+            start (int): Registry index of the first new instance.
+
+        Returns:
+            list[Self]: New instances, in registry order.
+        """
+        data_cache = cls._data_cache
+        instances: list[Self] = []
+        seen: set[TData] = set()
+        for data in data_list:
+            if data in data_cache or data in seen:
+                continue
+            seen.add(data)
+            instances.append(cls._build(data, start + len(instances)))
+        return instances
+
     @classmethod
     def extend_data(cls, data_list: Iterable[TData]) -> None:
         """
         Extend the registry with new instances from an iterable of data objects.
 
+        Instances are built without the lock, then checked and spliced into
+        the registry under a single acquisition of ``_lock``. A conflicting
+        batch registers nothing.
+
         Args:
             data_iterable (Iterable[TData]): Iterable of data objects to create instances from.
+
+        Raises:
+            ValueError: Key conflict.
         """
-        for data in data_list:
-            cls(data=data)
+        data_list = list(data_list)
+        start = len(cls.registry)
+        instances = cls._build_batch(data_list, start)
+
+        with cls._lock:
+            if len(cls.registry) != start:
+                # Another thread registered meanwhile; the indices are stale.
+                instances = cls._build_batch(data_list, len(cls.registry))
+            cls._commit(instances)
+
     @classmethod
     def clear_data(cls) -> None:
         """
-        Clear the registry and key dictionary, resetting them to None.
+        Clear the registry and key dictionary.
+
+        Fresh containers are swapped in rather than emptied in place, so a
+        reader holding the old ones keeps a consistent view.
         """
         with cls._lock:
-            cls.registry = None
-            cls.key_dictionary = None
+            cls._new_containers()
+            cls.get.cache_clear()
             
     @classmethod
     def load_data(cls, data_list: Iterable[TData]) -> None:
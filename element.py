@@ -1,10 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import sys
+from typing import NamedTuple, final
 from base_chemical_entity import BaseChemicalEntity
 
 
-@dataclass(frozen=True)
-class ElementData:
+class ElementData(NamedTuple):
     """
     Data container for Element.
 
@@ -16,18 +16,23 @@ class ElementData:
     atomic_weight: float | None = None
 
 
+@final
 class Element(BaseChemicalEntity[ElementData, str]):
     """
     Represents a fundamental chemical element with registry support.
 
-    This class extends BaseChemicalEntity and provides methods to generate
-    the display symbol of the element.
+    This class extends BaseChemicalEntity; the display symbol is taken from
+    the data, or generated from the index for anonymous elements.
 
     Attributes:
         symbol (str): Short element symbol.
         atomic_weight (float | None): Average atomic mass value.
     """
 
+    __slots__ = ("atomic_weight",)
+
+    _KIND = 0
+
     def generate_key(self) -> tuple[str]:
         """
         Generate registry key for the element.
@@ -37,14 +42,18 @@ class Element(BaseChemicalEntity[ElementData, str]):
         """
         return (self.symbol,)
 
-    def generate_symbol(self) -> str:
+    @classmethod
+    def precheck_key(cls, data: ElementData) -> str | None:
         """
-        Generate the display symbol of the element.
+        Return the explicit symbol of the element data, if any.
+
+        Args:
+            data (ElementData): Data for the prospective element.
 
         Returns:
-            str: Display symbol.
+            str | None: Registry key, or None if the symbol is generated.
         """
-        return self.data.symbol or f"<Element#{self.index}>"
+        return data.symbol
 
     def _init(self, index: int, data: ElementData) -> None:
         """
@@ -55,4 +64,9 @@ class Element(BaseChemicalEntity[ElementData, str]):
             data (ElementData): Data for the element.
         """
         super()._init(index, data)
-        self.symbol = self.generate_symbol()
\ No newline at end of file
+        self.atomic_weight = data.atomic_weight
+        symbol = data.symbol
+        if not symbol:
+            # Anonymous elements are named after their registry slot.
+            symbol = f"<Element#{index}>"
+        self.symbol = sys.intern(str(symbol))
\ No newline at end of file
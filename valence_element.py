@@ -1,11 +1,36 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import sys
+from typing import ClassVar, NamedTuple, Self
 from element import Element
 from base_chemical_entity import BaseChemicalEntity
 
+# A composition (base_element, valence) is keyed by a single packed int, which
+# is cheaper to hash than a tuple. Valences must lie in [-32, 32).
+_VALENCE_OFFSET = 32
+_VALENCE_SPAN = 64
 
-@dataclass(frozen=True)
-class ValenceElementData:
+# Signed valence strings ("+3", "-2", "+0") for the common range.
+_SIGN = {v: format(v, "+") for v in range(-16, 17)}
+
+# Generated display symbols by (base symbol, valence); survives table reloads.
+_SYMBOL_MEMO: dict[tuple[str, int], str] = {}
+
+
+def _composition_key(base_element: Element, valence: int) -> int:
+    """
+    Pack a base element and valence into a composition key.
+
+    Args:
+        base_element (Element): Base element.
+        valence (int): Oxidation state value.
+
+    Returns:
+        int: Composition key.
+    """
+    return base_element.index * _VALENCE_SPAN + valence + _VALENCE_OFFSET
+
+
+class ValenceElementData(NamedTuple):
     """
     Data container for ValenceElement.
 
@@ -19,9 +44,7 @@ class ValenceElementData:
     symbol: str | None = None
 
 
-class ValenceElement(
-    BaseChemicalEntity[ValenceElementData, tuple[str, tuple[Element, int]]]
-):
+class ValenceElement(BaseChemicalEntity[ValenceElementData, str]):
     """
     Represents an element with a specific oxidation state.
 
@@ -33,25 +56,167 @@ class ValenceElement(
         base_symbol (str): Symbol of the base element.
         valence (int): Oxidation state value.
         symbol (str): Display symbol of the valence element.
+        _comp_key (int): Packed composition key.
+        composition_dictionary (ClassVar[dict[int, ValenceElement]]): Mapping from
+            composition keys to instances.
     """
 
-    def generate_key(self) -> tuple[str, tuple[Element, int]]:
+    __slots__ = ("base_element", "base_symbol", "valence", "_comp_key")
+
+    composition_dictionary: ClassVar[dict[int, ValenceElement]]
+
+    _KIND = 1
+
+    def __new__(
+        cls,
+        identifier: int | str | tuple[Element, int] | None = None,
+        data: ValenceElementData | None = None,
+    ) -> Self:
+        """
+        Get an existing instance or create a new one.
+
+        Lookups dispatch on the identifier type here, without going through
+        BaseChemicalEntity.__new__; creation is delegated to it.
+
+        Args:
+            identifier (int | str | tuple[Element, int] | None): Existing ID, symbol or composition.
+            data (ValenceElementData | None): Data for new instance creation.
+
+        Returns:
+            Self: Retrieved or newly created instance.
+
+        Raises:
+            ValueError: Missing identifier/data or key conflict.
+            IndexError: Invalid integer identifier.
+            TypeError: Unsupported identifier type.
+        """
+        if data is not None:
+            return super().__new__(cls, identifier, data)
+        match identifier:
+            case int() if type(identifier) is int:
+                return cls.by_index(identifier)
+            case str():
+                instance = cls.key_dictionary.get(identifier)
+                if instance is not None:
+                    return instance
+            case (Element() as base_element, int() as valence):
+                try:
+                    return cls.by_composition(base_element, valence)
+                except KeyError:
+                    pass
+            case None:
+                raise ValueError("Must provide identifier or data")
+        raise TypeError(f"Invalid identifier type: {type(identifier)}")
+
+    def generate_key(self) -> tuple[str]:
         """
         Generate registry keys for the valence element.
 
+        Compositions are kept in ``composition_dictionary`` instead.
+
+        Returns:
+            tuple[str]: Registry keys.
+        """
+        return (self.symbol,)
+
+    @classmethod
+    def _new_containers(cls) -> None:
+        """
+        Bind fresh, empty registry containers and composition dictionary to the class.
+        """
+        super()._new_containers()
+        cls.composition_dictionary = {}
+
+    @classmethod
+    def _commit(cls, instances: list[ValenceElement]) -> None:
+        """
+        Add built instances to the registry and composition dictionary.
+
+        A composition registered for a different object than the instance's
+        base element is stale (its element was reloaded) and is replaced.
+
+        Args:
+            instances (list[ValenceElement]): Instances from ``_build``, indexed from ``len(registry)``.
+
+        Raises:
+            ValueError: Key or composition conflict.
+        """
+        composition_dictionary = cls.composition_dictionary
+        new_compositions: dict[int, ValenceElement] = {}
+        for instance in instances:
+            comp_key = instance._comp_key
+            existing = new_compositions.get(comp_key)
+            if existing is None:
+                existing = composition_dictionary.get(comp_key)
+            if existing is not None and existing.base_element is instance.base_element:
+                raise ValueError(
+                    f"Key conflict: {(instance.base_element, instance.valence)}"
+                )
+            new_compositions[comp_key] = instance
+        super()._commit(instances)
+        composition_dictionary.update(new_compositions)
+
+    @classmethod
+    def by_composition(cls, base_element: Element, valence: int) -> ValenceElement:
+        """
+        Look up a valence element by base element and valence.
+
+        Args:
+            base_element (Element): Base element.
+            valence (int): Oxidation state value.
+
+        Returns:
+            ValenceElement: Registered valence element.
+
+        Raises:
+            KeyError: Unknown composition.
+        """
+        instance = cls.composition_dictionary.get(
+            _composition_key(base_element, valence)
+        )
+        # Guard against stale elements and out-of-range valences aliasing a key.
+        if (
+            instance is None
+            or instance.base_element is not base_element
+            or instance.valence != valence
+        ):
+            raise KeyError((base_element, valence))
+        return instance
+
+    @classmethod
+    def precheck_key(cls, data: ValenceElementData) -> str | None:
+        """
+        Return the custom symbol, if any.
+
+        Args:
+            data (ValenceElementData): Data for the prospective valence element.
+
         Returns:
-            tuple[str, tuple[Element, int]]: Registry keys.
+            str | None: Registry key, or None if only the generated symbol is.
         """
-        return (self.symbol, (self.base_element, self.valence))
+        return data.symbol or None
 
     def generate_symbol(self) -> str:
         """
         Generate the display symbol of the valence element.
 
+        Generated symbols are memoized per (base symbol, valence).
+
         Returns:
             str: Display symbol.
         """
-        return self.data.symbol or f"{self.base_element.symbol}({self.valence:+})"
+        if self.data.symbol:
+            return self.data.symbol
+        key = (self.base_element.symbol, self.valence)
+        symbol = _SYMBOL_MEMO.get(key)
+        if symbol is None:
+            sign = _SIGN.get(self.valence)
+            if sign is None:
+                sign = format(self.valence, "+")
+            symbol = _SYMBOL_MEMO.setdefault(
+                key, sys.intern(str(self.base_element.symbol + "(" + sign + ")"))
+            )
+        return symbol
 
     def _init(self, index: int, data: ValenceElementData) -> None:
         """
@@ -60,9 +225,15 @@ class ValenceElement(
         Args:
             index (int): Index of the instance in the registry.
             data (ValenceElementData): Data for the valence element.
+
+        Raises:
+            ValueError: Valence outside the packable range.
         """
         super()._init(index, data)
+        if not -_VALENCE_OFFSET <= data.valence < _VALENCE_SPAN - _VALENCE_OFFSET:
+            raise ValueError(f"Valence out of range: {data.valence}")
         self.base_element = data.base_element
         self.base_symbol = self.base_element.symbol
         self.valence = data.valence
-        self.symbol = self.generate_symbol()
\ No newline at end of file
+        self._comp_key = _composition_key(data.base_element, data.valence)
+        self.symbol = sys.intern(str(self.generate_symbol()))
\ No newline at end of file